@@ -0,0 +1,33 @@
+import os
+import functools
+import soundfile as sf
+
+
+@functools.lru_cache(maxsize=None)
+def read_clean_signal(file_path):
+    """
+    Read a clean .wav file once per worker process and reuse it afterwards.
+
+    Args:
+        file_path (str): Path to the clean .wav file.
+
+    Returns:
+        tuple: The (read-only) signal and its sampling rate.
+    """
+    signal, fs = sf.read(file_path, dtype="float32")
+    signal.setflags(write=False)
+    return signal, fs
+
+
+def list_wav_files(folder):
+    """
+    List the .wav files of a folder in sorted order.
+    """
+    return sorted([f for f in os.listdir(folder) if f.endswith(".wav")])
+
+
+def list_subfolders(folder):
+    """
+    List the subfolders of a folder.
+    """
+    return [f for f in os.listdir(folder) if os.path.isdir(os.path.join(folder, f))]
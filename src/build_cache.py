@@ -0,0 +1,118 @@
+import os
+import re
+import glob
+import pandas as pd
+
+# Parquet file holding the mean scores of every metric folder
+CACHE_PATH = "scores.parquet"
+
+# Folder names look like "<metric>_scores_<language>_mean" or "<metric>_scores_mean"
+FOLDER_PATTERN = re.compile(r"^(?P<metric>[^_]+)_scores(?:_(?P<language>[^_]+))?_mean$")
+
+
+def parse_folder_name(folder):
+    """
+    Extract the metric and language from a mean score folder name.
+
+    Args:
+        folder (str): Path to a folder containing mean score CSV files.
+
+    Returns:
+        tuple: (metric, language), where language is "" for language independent
+               metrics such as STIPA, or None if the folder name does not match.
+    """
+    match = FOLDER_PATTERN.match(os.path.basename(os.path.normpath(folder)))
+    if match is None:
+        return None
+    return match.group("metric"), match.group("language") or ""
+
+
+def build_cache(base_folder=".", cache_path=CACHE_PATH):
+    """
+    Read every mean score folder once and store all scores in a single Parquet file.
+
+    Args:
+        base_folder (str): Folder containing the "*_scores*_mean" folders.
+        cache_path (str): Path of the Parquet file to write.
+
+    Returns:
+        pd.DataFrame: A DataFrame with columns: folder (absolute path), metric, language,
+                      t60, rir, and mean_score, or None if no mean score folder was found.
+    """
+    frames = []
+    for folder in sorted(glob.glob(os.path.join(base_folder, "*_scores*_mean"))):
+        parsed = parse_folder_name(folder)
+        if parsed is None or not os.path.isdir(folder):
+            continue
+        metric, language = parsed
+
+        for file_path in glob.glob(os.path.join(folder, "*_mean_scores.csv")):
+            t60 = float(os.path.basename(file_path).split("_mean_scores")[0])
+            df = pd.read_csv(file_path, usecols=[
+                             "rir", "mean_score"], engine="pyarrow")
+            df["folder"] = os.path.abspath(folder)
+            df["metric"] = metric
+            df["language"] = language
+            df["t60"] = t60
+            frames.append(df)
+
+    if not frames:
+        print(
+            f"No mean score CSV files found in \"*_scores*_mean\" folders under {os.path.abspath(base_folder)}")
+        return None
+
+    scores = pd.concat(frames, ignore_index=True)
+
+    # Convert the score column to numeric and drop rows without a score
+    scores["mean_score"] = pd.to_numeric(scores["mean_score"], errors="coerce")
+    scores = scores.dropna(subset=["mean_score"])
+
+    scores = scores[["folder", "metric", "language", "t60", "rir", "mean_score"]].astype({
+        "folder": "string", "metric": "string", "language": "string", "t60": "float64",
+        "rir": "string", "mean_score": "float64"})
+    scores.to_parquet(cache_path, compression="zstd", index=False)
+    return scores
+
+
+def is_cache_stale(folder, cache_path=CACHE_PATH):
+    """
+    Check whether the folder or any of its mean score CSV files changed after the cache was written.
+    """
+    cache_time = os.path.getmtime(cache_path)
+    paths = [folder] + glob.glob(os.path.join(folder, "*_mean_scores.csv"))
+    return any(os.path.getmtime(path) > cache_time for path in paths)
+
+
+def read_cached_scores(folder, t60_range=None, cache_path=CACHE_PATH):
+    """
+    Read the mean scores of one folder from the Parquet cache.
+
+    Args:
+        folder (str): Path to the folder whose scores are requested.
+        t60_range (tuple): A tuple (min_t60, max_t60) specifying the range of T60 values to consider.
+                           If None, all T60 values are included.
+        cache_path (str): Path of the Parquet file written by build_cache.
+
+    Returns:
+        pd.DataFrame: A DataFrame with columns: t60, rir, and mean_score, or None if the
+                      cache does not exist, is older than the folder's CSV files, or holds
+                      no scores for the folder.
+    """
+    if not os.path.exists(cache_path) or not os.path.isdir(folder):
+        return None
+    if is_cache_stale(folder, cache_path):
+        return None
+
+    filters = [("folder", "==", os.path.abspath(folder))]
+    if t60_range:
+        filters += [("t60", ">=", t60_range[0]), ("t60", "<=", t60_range[1])]
+
+    scores = pd.read_parquet(cache_path, columns=[
+                             "t60", "rir", "mean_score"], filters=filters)
+    return scores if not scores.empty else None
+
+
+if __name__ == "__main__":
+    scores = build_cache()
+    if scores is not None:
+        print(f"Cached {len(scores)} scores in {CACHE_PATH}")
@@ -1,13 +1,18 @@
 import os
+import glob
+import math
 import pandas as pd
-from scipy.stats import pearsonr, kendalltau
+from scipy.stats import pearsonr
 import numpy as np
+from _kendall_numba import kendall_tau_c
+from build_cache import read_cached_scores
 
 
 def load_scores(folder, t60_range=None):
     """
     Load scores from CSV files in the folder, associate them with T60 and RIR,
-    and optionally filter by T60 range.
+    and optionally filter by T60 range. Scores are read from the Parquet cache
+    written by build_cache.py when it is available.
 
     Args:
         folder (str): Path to the folder containing score CSV files.
@@ -17,13 +22,15 @@ def load_scores(folder, t60_range=None):
     Returns:
         pd.DataFrame: A DataFrame with columns: T60, RIR (mic and source position), and score.
     """
-    # List all CSV files in the folder
-    csv_files = [f for f in os.listdir(
-        folder) if f.endswith("_mean_scores.csv")]
+    # Use the Parquet cache if it holds this folder
+    cached = read_cached_scores(folder, t60_range)
+    if cached is not None:
+        return cached.rename(columns={"mean_score": "score"})
 
-    scores = []
+    frames = []
 
-    for csv_file in csv_files:
+    for csv_path in glob.glob(os.path.join(folder, "*_mean_scores.csv")):
+        csv_file = os.path.basename(csv_path)
         try:
             # Extract the T60 value from the filename (before "_mean_scores.csv")
             t60 = float(csv_file.split("_mean_scores")[0])
@@ -32,27 +39,31 @@ def load_scores(folder, t60_range=None):
             if t60_range and not (t60_range[0] <= t60 <= t60_range[1]):
                 continue
 
-            csv_path = os.path.join(folder, csv_file)
-            # Read the CSV file
-            df = pd.read_csv(csv_path, header=None, names=[
-                             "rir", "score", "count"])
-
-            # Convert the score column to numeric, coercing errors
-            df["score"] = pd.to_numeric(df["score"], errors="coerce")
-
-            # Drop rows with NaN scores
-            df = df.dropna(subset=["score"])
+            # Read only the columns we need
+            df = pd.read_csv(csv_path, usecols=["rir", "mean_score"], dtype={
+                             "rir": "string"}, engine="pyarrow")
 
             # Add T60 value to each row
             df["t60"] = t60
 
-            # Collect the relevant data
-            scores.append(df[["t60", "rir", "score"]])
+            frames.append(df)
         except Exception as e:
             print(f"Failed to process {csv_file}: {e}")
 
+    if not frames:
+        return pd.DataFrame()
+
     # Concatenate all data into a single DataFrame
-    return pd.concat(scores, ignore_index=True) if scores else pd.DataFrame()
+    scores = pd.concat(frames, ignore_index=True)
+    scores = scores.rename(columns={"mean_score": "score"})
+
+    # Convert the score column to numeric, coercing errors
+    scores["score"] = pd.to_numeric(scores["score"], errors="coerce")
+
+    # Drop rows with NaN scores
+    scores = scores.dropna(subset=["score"])
+
+    return scores[["t60", "rir", "score"]]
 
 
 def calculate_folders_metrics(folder1, folder2, t60_range=None):
@@ -73,27 +84,37 @@ def calculate_folders_metrics(folder1, folder2, t60_range=None):
     scores1 = load_scores(folder1, t60_range)
     scores2 = load_scores(folder2, t60_range)
 
-    # Merge the two DataFrames on T60 and RIR
-    merged_df = pd.merge(scores1, scores2, on=[
-                         "t60", "rir"], suffixes=("_1", "_2"))
+    # Index both score sets by T60 and RIR
+    s1 = scores1.set_index(["t60", "rir"])["score"].astype("float64")
+    s2 = scores2.set_index(["t60", "rir"])["score"].astype("float64")
+    del scores1, scores2
+
+    if not (s1.index.is_unique and s2.index.is_unique):
+        raise ValueError(
+            "Duplicate T60 and RIR pairs found in the score files.")
+
+    # Pair up the scores sharing the same T60 and RIR
+    x, y = s1.align(s2, join="inner")
 
-    if merged_df.empty:
+    if x.empty:
         raise ValueError(
             "No common T60 and RIR pairs found between the two folders within the specified range."
         )
 
-    # Extract scores
-    x = merged_df["score_1"]
-    y = merged_df["score_2"]
+    # Extract scores and release the indexed Series
+    x = x.to_numpy(dtype=np.float64)
+    y = y.to_numpy(dtype=np.float64)
+    del s1, s2
 
     # Calculate Pearson's correlation
     pearson_corr, _ = pearsonr(x, y)
 
     # Calculate Kendall's Tau
-    kendall_corr, kendall_p_value = kendalltau(x, y, variant="c")
+    kendall_corr, kendall_p_value = kendall_tau_c(x, y)
 
     # Calculate RMSE
-    rmse = np.sqrt(np.mean((x - y) ** 2))
+    diff = x - y
+    rmse = math.sqrt(np.dot(diff, diff) / diff.size)
 
     return {
         "pearson": pearson_corr,
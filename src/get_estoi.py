@@ -1,9 +1,13 @@
 import os
-import csv
+import logging
 import numpy as np
+import pandas as pd
 import soundfile as sf
 from pystoi import stoi
 from joblib import Parallel, delayed
+from _audio_io import read_clean_signal, list_wav_files, list_subfolders
+
+logger = logging.getLogger(__name__)
 
 # Paths
 clean_audio_folder = "clean_english"  # Folder containing clean .wav files
@@ -22,88 +26,83 @@ t60_folders = [
 ]
 
 
-def process_rir_folder(rir_folder_path, clean_audio_folder, output_csv_path, rir_subfolder_name):
+def score_one_pair(job):
     """
-    Process a single RIR folder to calculate eSTOI scores.
+    Calculate the eSTOI score of a single clean/degraded file pair.
     """
-    with open(output_csv_path, mode="a", newline="") as csvfile:
-        csv_writer = csv.writer(csvfile)
-
-        # List all clean and degraded files
-        clean_files = sorted([f for f in os.listdir(
-            clean_audio_folder) if f.endswith(".wav")])
-        degraded_files = sorted(
-            [f for f in os.listdir(rir_folder_path) if f.endswith(".wav")])
-
-        # Check if the number of files matches
-        if len(clean_files) != len(degraded_files):
+    t60_folder, rir_folder, clean_file, degraded_file = job
+    clean_file_path = os.path.join(clean_audio_folder, clean_file)
+    degraded_file_path = os.path.join(
+        degraded_base_folder, t60_folder, rir_folder, degraded_file)
+
+    try:
+        # Read clean and degraded audio files
+        clean_signal, fs_clean = read_clean_signal(clean_file_path)
+        degraded_signal, fs_degraded = sf.read(
+            degraded_file_path, dtype="float32")
+
+        # Ensure the sampling rates match
+        if fs_clean != fs_degraded:
             raise ValueError(
-                f"Mismatch: {len(clean_files)} clean files vs {len(degraded_files)} degraded files in {rir_folder_path}"
+                f"Sampling rates do not match for {clean_file} and {degraded_file}"
             )
 
-        # Process each file pair
-        for clean_file, degraded_file in zip(clean_files, degraded_files):
-            clean_file_path = os.path.join(clean_audio_folder, clean_file)
-            degraded_file_path = os.path.join(rir_folder_path, degraded_file)
+        # Pad the clean signal to match the length of the degraded signal
+        if len(clean_signal) < len(degraded_signal):
+            padding = len(degraded_signal) - len(clean_signal)
+            clean_signal = np.pad(
+                clean_signal, (0, padding), mode="constant")
+        elif len(clean_signal) > len(degraded_signal):
+            clean_signal = clean_signal[:len(degraded_signal)]
 
-            try:
-                # Read clean and degraded audio files
-                clean_signal, fs_clean = sf.read(clean_file_path)
-                degraded_signal, fs_degraded = sf.read(degraded_file_path)
+        # Calculate eSTOI score
+        estoi_score = stoi(
+            clean_signal, degraded_signal, fs_clean, extended=True)
 
-                # Ensure the sampling rates match
-                if fs_clean != fs_degraded:
-                    raise ValueError(
-                        f"Sampling rates do not match for {clean_file} and {degraded_file}"
-                    )
+        # Add the subfolder name to the degraded file name
+        file_record_name = f"{rir_folder}/{degraded_file}"
 
-                # Pad the clean signal to match the length of the degraded signal
-                if len(clean_signal) < len(degraded_signal):
-                    padding = len(degraded_signal) - len(clean_signal)
-                    clean_signal = np.pad(
-                        clean_signal, (0, padding), mode="constant")
-                elif len(clean_signal) > len(degraded_signal):
-                    clean_signal = clean_signal[:len(degraded_signal)]
+        logger.debug("Processed %s: eSTOI=%.3f", file_record_name, estoi_score)
+        return t60_folder, file_record_name, estoi_score
 
-                # Calculate eSTOI score
-                estoi_score = stoi(
-                    clean_signal, degraded_signal, fs_clean, extended=True)
+    except Exception as e:
+        # Handle errors and log them
+        print(f"Failed to process {degraded_file}: {e}")
+        return t60_folder, degraded_file, f"Error: {str(e)}"
 
-                # Add the subfolder name to the degraded file name
-                file_record_name = f"{rir_subfolder_name}/{degraded_file}"
 
-                # Write the score to the CSV file
-                csv_writer.writerow([file_record_name, estoi_score])
-                print(f"Processed {file_record_name}: eSTOI={estoi_score:.3f}")
+# List all clean files once for every RIR folder
+clean_files = list_wav_files(clean_audio_folder)
 
-            except Exception as e:
-                # Handle errors and log them
-                csv_writer.writerow([degraded_file, f"Error: {str(e)}"])
-                print(f"Failed to process {degraded_file}: {e}")
-
-
-def process_t60_folder(t60_folder):
-    """
-    Process a single T60 folder containing multiple RIR folders.
-    """
+# Build one job per clean/degraded file pair across all T60 and RIR folders
+jobs = []
+for t60_folder in t60_folders:
     t60_folder_path = os.path.join(degraded_base_folder, t60_folder)
-    output_csv_path = os.path.join(
-        output_folder_path, f"{t60_folder}_estoi_scores.csv")
+    for rir_folder in list_subfolders(t60_folder_path):
+        rir_folder_path = os.path.join(t60_folder_path, rir_folder)
 
-    # List all RIR folders within the T60 folder
-    rir_folders = [
-        f for f in os.listdir(t60_folder_path) if os.path.isdir(os.path.join(t60_folder_path, f))
-    ]
+        # List all degraded files
+        degraded_files = list_wav_files(rir_folder_path)
 
-    # Process each RIR folder
-    for rir_folder in rir_folders:
-        rir_folder_path = os.path.join(t60_folder_path, rir_folder)
-        process_rir_folder(rir_folder_path, clean_audio_folder,
-                           output_csv_path, rir_folder)
+        # Check if the number of files matches
+        if len(clean_files) != len(degraded_files):
+            raise ValueError(
+                f"Mismatch: {len(clean_files)} clean files vs {len(degraded_files)} degraded files in {rir_folder_path}"
+            )
+
+        jobs.extend((t60_folder, rir_folder, clean_file, degraded_file)
+                    for clean_file, degraded_file in zip(clean_files, degraded_files))
 
+# Parallel processing for each file pair
+results = Parallel(n_jobs=-1, backend="loky", batch_size="auto")(
+    delayed(score_one_pair)(job) for job in jobs)
 
-# Parallel processing for each T60 folder
-Parallel(n_jobs=-1)(delayed(process_t60_folder)(folder)
-                    for folder in t60_folders)
+# Write one CSV file per T60 folder
+results_df = pd.DataFrame(results, columns=["t60", "file", "score"])
+for t60_folder, t60_results in results_df.groupby("t60", sort=False):
+    output_csv_path = os.path.join(
+        output_folder_path, f"{t60_folder}_estoi_scores.csv")
+    t60_results[["file", "score"]].to_csv(
+        output_csv_path, header=False, index=False)
 
 print(f"All eSTOI scores saved in {output_folder_path}")
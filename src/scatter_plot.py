@@ -1,8 +1,46 @@
 import os
+import glob
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.colors import ListedColormap
 import numpy as np
 import math
+from build_cache import read_cached_scores
+
+
+def load_mean_scores(folder):
+    """
+    Load the mean scores of every T60 in the folder into a single DataFrame,
+    using the Parquet cache written by build_cache.py when it is available.
+
+    Args:
+        folder (str): Folder containing "<T60>_mean_scores.csv" files.
+
+    Returns:
+        pd.DataFrame: A DataFrame with columns: rir, mean_score, and t60.
+    """
+    cached = read_cached_scores(folder)
+    if cached is not None:
+        return cached
+
+    frames = []
+    for file_path in glob.glob(os.path.join(folder, "*_mean_scores.csv")):
+        t60 = float(os.path.basename(file_path).split("_mean_scores")[0])
+        df = pd.read_csv(file_path, usecols=["rir", "mean_score"], dtype={
+                         "rir": "string"}, engine="pyarrow")
+        df["t60"] = t60
+        frames.append(df)
+
+    if not frames:
+        return pd.DataFrame({"rir": pd.Series(dtype="string"),
+                             "mean_score": pd.Series(dtype="float64"),
+                             "t60": pd.Series(dtype="float64")})
+
+    scores = pd.concat(frames, ignore_index=True)
+
+    # Convert the score column to numeric and drop rows without a score
+    scores["mean_score"] = pd.to_numeric(scores["mean_score"], errors="coerce")
+    return scores.dropna(subset=["mean_score"])
 
 
 def plot_scatter(x_folders_with_labels, y_folder, output_label, subplots_per_row=2):
@@ -21,15 +59,7 @@ def plot_scatter(x_folders_with_labels, y_folder, output_label, subplots_per_row
 
     # Collect data for the y-folder
     print(f"Processing Y folder: {y_folder} with label '{output_label}'...")
-    y_data = {}
-    for file_name in os.listdir(y_folder):
-        if file_name.endswith("_mean_scores.csv"):
-            t60 = file_name.split("_")[0]
-            file_path = os.path.join(y_folder, file_name)
-            df = pd.read_csv(file_path)
-            for _, row in df.iterrows():
-                rir = row["rir"]
-                y_data[(t60, rir)] = row["mean_score"]
+    y_data = load_mean_scores(y_folder)
 
     # Prepare subplots
     num_subplots = len(x_folders_with_labels)
@@ -42,42 +72,37 @@ def plot_scatter(x_folders_with_labels, y_folder, output_label, subplots_per_row
     for subplot_idx, (x_folder, x_label) in enumerate(x_folders_with_labels.items()):
         ax = axes[subplot_idx]
         print(f"Processing X folder: {x_folder} with label '{x_label}'...")
-        x_data = {}
 
         # Collect data for the x-folder
-        for file_name in os.listdir(x_folder):
-            if file_name.endswith("_mean_scores.csv"):
-                t60 = file_name.split("_")[0]
-                file_path = os.path.join(x_folder, file_name)
-                df = pd.read_csv(file_path)
-                for _, row in df.iterrows():
-                    rir = row["rir"]
-                    x_data[(t60, rir)] = row["mean_score"]
+        x_data = load_mean_scores(x_folder)
 
         # Match data points between x and y folders
-        common_keys = sorted(set(x_data.keys()).intersection(y_data.keys()))
-        x_scores = np.array([x_data[key] for key in common_keys])
-        y_scores = np.array([y_data[key] for key in common_keys])
-        t60_values = [key[0] for key in common_keys]  # Extract T60 values
+        merged = x_data.merge(y_data, on=["t60", "rir"], how="inner",
+                              validate="one_to_one", suffixes=("_x", "_y"))
+        merged = merged.sort_values(["t60", "rir"])
+        x_scores = merged["mean_score_x"].to_numpy()
+        y_scores = merged["mean_score_y"].to_numpy()
+        t60_values = merged["t60"].to_numpy()  # Extract T60 values
 
         # Generate distinct colors for each T60 value
-        unique_t60 = sorted(set(t60_values))
-        color_map = {t60: plt.cm.viridis(i / len(unique_t60))
-                     for i, t60 in enumerate(unique_t60)}
+        t60_codes, unique_t60 = pd.factorize(t60_values, sort=True)
+        cmap = ListedColormap(plt.cm.viridis(
+            np.arange(len(unique_t60)) / len(unique_t60)))
 
         # Scatter plot for current x-folder against the y-folder
-        for t60, x, y in zip(t60_values, x_scores, y_scores):
-            ax.scatter(
-                x, y, label=f"T60={t60}", color=color_map[t60],
-                alpha=0.8, edgecolor='k', s=30  # Marker size
-            )
+        ax.scatter(
+            x_scores, y_scores, c=t60_codes, cmap=cmap,
+            vmin=-0.5, vmax=len(unique_t60) - 0.5,
+            alpha=0.8, edgecolor='k', s=30  # Marker size
+        )
 
         # Plot settings for the subplot
         ax.set_xlabel(f"{x_label} (Scores)")
         ax.set_ylabel(f"{output_label} (Scores)")
         # ax.set_title(f"{x_label} vs {output_label}")
         ax.grid(alpha=0.5, linestyle='--')
-        # ax.legend()
+        # ax.legend(ax.collections[0].legend_elements()[0],
+        #           [f"T60={t60}" for t60 in unique_t60])
 
     # Hide unused subplots
     for idx in range(len(x_folders_with_labels), len(axes)):
@@ -1,8 +1,10 @@
 import os
+import glob
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import math
+from build_cache import read_cached_scores
 
 
 def plot_mean_std(input_folders_with_labels, y_limits=None, folders_per_subplot=2, subplots_per_row=2, show_std=True):
@@ -29,33 +31,41 @@ def plot_mean_std(input_folders_with_labels, y_limits=None, folders_per_subplot=
     # Collect data for each folder
     for folder, label in input_folders_with_labels.items():
         print(f"Processing folder: {folder} with label '{label}'...")
-        plot_data = []
+        # Use the Parquet cache if it holds this folder
+        scores = read_cached_scores(folder)
 
-        for file_name in os.listdir(folder):
-            if file_name.endswith("_mean_scores.csv"):
+        if scores is not None:
+            # Mean and standard deviation of the scores per T60, sorted by T60
+            plot_df = scores.groupby("t60")["mean_score"].agg(
+                ["mean", "std"]).reset_index()
+        else:
+            plot_data = []
+
+            for file_path in glob.glob(os.path.join(folder, "*_mean_scores.csv")):
                 # Extract T60 value from the filename
-                t60 = file_name.split("_")[0]
-                file_path = os.path.join(folder, file_name)
+                t60_value = float(os.path.basename(file_path).split("_")[0])
 
-                # Read the CSV file
-                df = pd.read_csv(file_path)
+                # Read only the score column, dropping non-numeric scores
+                scores = pd.read_csv(file_path, usecols=[
+                                     "mean_score"], engine="pyarrow")["mean_score"]
+                scores = pd.to_numeric(
+                    scores, errors="coerce").dropna().to_numpy()
 
                 # Append T60 and mean scores
-                t60_value = float(t60)
-                mean_score = df["mean_score"].mean()
-                std_score = df["mean_score"].std()
-
-                all_t60_values.add(t60_value)
                 plot_data.append(
-                    {"t60": t60_value, "mean": mean_score, "std": std_score})
+                    {"t60": t60_value, "mean": scores.mean(), "std": scores.std(ddof=1)})
+
+            # Convert plot_data to a DataFrame and sort by T60
+            plot_df = pd.DataFrame(plot_data).sort_values(
+                by="t60", ignore_index=True)
 
-        # Convert plot_data to a DataFrame and sort by T60
-        plot_df = pd.DataFrame(plot_data).sort_values(by="t60")
+        all_t60_values.update(plot_df["t60"])
         all_plot_data.append((plot_df, label))
 
     # Sort T60 values and create equal spacing for the x-axis
     sorted_t60_values = sorted(all_t60_values)
     x_positions = np.arange(len(sorted_t60_values))
+    x_position_of = pd.Series(x_positions, index=pd.Index(sorted_t60_values))
 
     # Calculate the number of subplots needed
     num_subplots = math.ceil(len(all_plot_data) / folders_per_subplot)
@@ -76,9 +86,7 @@ def plot_mean_std(input_folders_with_labels, y_limits=None, folders_per_subplot=
             color = colors[idx % len(colors)]
 
             # Map T60 values to x positions
-            plot_df["x_pos"] = plot_df["t60"].apply(
-                lambda t: x_positions[sorted_t60_values.index(t)]
-            )
+            plot_df["x_pos"] = plot_df["t60"].map(x_position_of).to_numpy()
 
             # Plot the data
             if show_std:
@@ -1,6 +1,8 @@
 import os
+import glob
 import pandas as pd
 from scipy.stats import levene
+from build_cache import read_cached_scores
 
 
 def get_t60_data(folder):
@@ -11,25 +13,30 @@ def get_t60_data(folder):
         folder (str): Path to the folder containing the metric files.
 
     Returns:
-        dict: A dictionary where keys are T60 values and values are lists of scores.
+        dict: A dictionary, sorted by T60, where keys are T60 values and values are arrays of scores.
     """
+    # Use the Parquet cache if it holds this folder
+    cached = read_cached_scores(folder)
+    if cached is not None:
+        return {t60: scores.to_numpy() for t60, scores in cached.groupby("t60")["mean_score"]}
+
     t60_data = {}
-    for file_name in os.listdir(folder):
-        if file_name.endswith("_mean_scores.csv"):
-            try:
-                # Extract T60 from the filename
-                t60 = float(file_name.split("_mean_scores")[0])
-                file_path = os.path.join(folder, file_name)
+    for file_path in glob.glob(os.path.join(folder, "*_mean_scores.csv")):
+        file_name = os.path.basename(file_path)
+        try:
+            # Extract T60 from the filename
+            t60 = float(file_name.split("_mean_scores")[0])
 
-                # Read the file
-                df = pd.read_csv(file_path)
+            # Read only the score column, dropping non-numeric scores
+            scores = pd.read_csv(file_path, usecols=[
+                                 "mean_score"], engine="pyarrow")["mean_score"]
+            scores = pd.to_numeric(scores, errors="coerce").dropna().to_numpy()
 
-                # Collect scores
-                scores = df["mean_score"].tolist()
-                t60_data[t60] = scores
-            except Exception as e:
-                print(f"Error processing {file_name} in {folder}: {e}")
-    return t60_data
+            # Collect scores
+            t60_data[t60] = scores
+        except Exception as e:
+            print(f"Error processing {file_name} in {folder}: {e}")
+    return dict(sorted(t60_data.items()))
 
 
 def levene_test_between_folders(folder1, folder2, output_file="levene_results.csv"):
@@ -76,7 +83,6 @@ def levene_test_between_folders(folder1, folder2, output_file="levene_results.cs
 
     # Save results to a CSV file
     results_df = pd.DataFrame(results)
-    results_df = results_df.sort_values(by="T60")
     results_df.to_csv(output_file, index=False)
     print(f"\nResults saved to {output_file}")
 